@@ -8,13 +8,20 @@ from abc import ABC, abstractmethod
 from importlib import resources
 from typing import Any
 
-import jsonschema
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
 from regis.registry.client import RegistryClient
 
 logger = logging.getLogger(__name__)
 
 
+# Validators keyed by (analyzer class, schema_file), so a subclass overriding
+# ``_load_schema`` gets its own entry.
+_VALIDATORS: dict[tuple[type[BaseAnalyzer], str], Validator] = {}
+
+
 class AnalyzerError(Exception):
     """Raised when an analyzer encounters an error."""
 
@@ -71,13 +78,24 @@ class BaseAnalyzer(ABC):
         Raises:
             AnalyzerError: If the report does not conform to the schema.
         """
-        schema = self._load_schema()
-        try:
-            jsonschema.validate(instance=report, schema=schema)
-        except jsonschema.ValidationError as exc:
+        # Same checks and error selection as ``jsonschema.validate``, with the
+        # schema loaded and checked once per analyzer class instead of per call.
+        error = best_match(self._get_validator().iter_errors(report))
+        if error is not None:
             raise AnalyzerError(
-                f"Report from analyzer '{self.name}' failed schema validation: {exc.message}"
-            ) from exc
+                f"Report from analyzer '{self.name}' failed schema validation: {error.message}"
+            ) from error
+
+    def _get_validator(self) -> Validator:
+        """Return the validator for this analyzer's schema, built on first use."""
+        key = (type(self), self.schema_file)
+        validator = _VALIDATORS.get(key)
+        if validator is None:
+            schema = self._load_schema()
+            validator_cls = validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = _VALIDATORS[key] = validator_cls(schema)
+        return validator
 
     def _load_schema(self) -> dict[str, Any]:
         """Load the JSON Schema file from the ``regis.schemas`` package."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from importlib.metadata import entry_points
 
@@ -11,7 +12,17 @@ logger = logging.getLogger(__name__)
 
 
 def discover_analyzers() -> dict[str, type[BaseAnalyzer]]:
-    """Discover all registered analyzers via entry_points."""
+    """Discover all registered analyzers via entry_points.
+
+    Entry points are scanned and loaded once per process; each call returns a
+    fresh dict so callers may modify it.
+    """
+    return dict(_load_analyzers())
+
+
+@functools.cache
+def _load_analyzers() -> dict[str, type[BaseAnalyzer]]:
+    """Scan and load the ``regis.analyzers`` entry points."""
     eps = entry_points(group="regis.analyzers")
     discovered: dict[str, type[BaseAnalyzer]] = {}
     for ep in eps:
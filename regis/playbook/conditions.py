@@ -8,6 +8,7 @@ repeated try/except blocks that were scattered across the original engine.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -54,44 +55,80 @@ def evaluate_condition(
         return ConditionResult(passed=False, incomplete=True)
 
 
-def _stringify_condition(condition: Any, context: dict[str, Any]) -> str:
-    """Turn a JsonLogic condition into a human-readable string with values.
+def _call_str(op: Any, parts: list[str]) -> str:
+    return f"{op}({', '.join(parts)})"
 
-    Example: {">": [{"var": "a"}, 10]} -> "a (42) > 10"
-    """
-    if not isinstance(condition, dict) or not condition:
-        if condition is None:
-            return "MISSING"
-        return str(condition)
 
-    op = list(condition.keys())[0]
-    args = condition[op]
+def _infix(op: str) -> Callable[[list[str]], str]:
+    def _fmt(parts: list[str]) -> str:
+        if len(parts) >= 2:
+            return f"{parts[0]} {op} {parts[1]}"
+        return _call_str(op, parts)
 
-    # Handle var specifically: "key (value)"
-    if op == "var":
-        val = context.get(args)
-        if val is None:
-            return f"{args} (MISSING)"
-        return f"{args} ({val})"
+    return _fmt
 
-    if not isinstance(args, list):
-        args = [args]
 
-    # Recurse on arguments
-    parts = [_stringify_condition(a, context) for a in args]
+def _joined(op: str) -> Callable[[list[str]], str]:
+    # One join over the parts instead of an f-string per part: "(a) and (b)".
+    sep = f") {op} ("
 
-    # Pretty-print common operators
-    if op in (">", ">=", "<", "<=", "==", "!="):
-        if len(parts) >= 2:
-            return f"{parts[0]} {op} {parts[1]}"
-        return f"{op}({', '.join(parts)})"
-    if op == "in" and len(parts) == 2:
-        return f"{parts[0]} in {parts[1]}"
-    if op == "!" and len(parts) == 1:
-        return f"!({parts[0]})"
-    if op == "and":
-        return " and ".join(f"({p})" for p in parts)
-    if op == "or":
-        return " or ".join(f"({p})" for p in parts)
+    def _fmt(parts: list[str]) -> str:
+        return f"({sep.join(parts)})" if parts else ""
 
-    return f"{op}({', '.join(parts)})"
+    return _fmt
+
+
+# Pretty-printers for common operators; anything else renders as ``op(a, b)``.
+_FORMATTERS: dict[Any, Callable[[list[str]], str]] = {
+    op: _infix(op) for op in (">", ">=", "<", "<=", "==", "!=")
+}
+_FORMATTERS["in"] = lambda parts: (
+    f"{parts[0]} in {parts[1]}" if len(parts) == 2 else _call_str("in", parts)
+)
+_FORMATTERS["!"] = lambda parts: (
+    f"!({parts[0]})" if len(parts) == 1 else _call_str("!", parts)
+)
+_FORMATTERS["and"] = _joined("and")
+_FORMATTERS["or"] = _joined("or")
+
+
+def _stringify_condition(condition: Any, context: dict[str, Any]) -> str:
+    """Turn a JsonLogic condition into a human-readable string with values.
+
+    Example: {">": [{"var": "a"}, 10]} -> "a (42) > 10"
+
+    Walks the condition iteratively: operator nodes are expanded onto an explicit
+    stack and formatted once their arguments have been rendered (post-order).
+    """
+    # Stack items are either ("node", condition) or ("op", (operator, n_args)).
+    stack: list[tuple[str, Any]] = [("node", condition)]
+    rendered: list[str] = []
+    while stack:
+        kind, item = stack.pop()
+        if kind == "op":
+            op, n_args = item
+            parts = rendered[len(rendered) - n_args :]
+            del rendered[len(rendered) - n_args :]
+            formatter = _FORMATTERS.get(op)
+            rendered.append(formatter(parts) if formatter else _call_str(op, parts))
+            continue
+
+        if not isinstance(item, dict) or not item:
+            rendered.append("MISSING" if item is None else str(item))
+            continue
+
+        op = next(iter(item))
+        args = item[op]
+
+        # Handle var specifically: "key (value)"
+        if op == "var":
+            val = context.get(args)
+            rendered.append(f"{args} (MISSING)" if val is None else f"{args} ({val})")
+            continue
+
+        if not isinstance(args, list):
+            args = [args]
+        stack.append(("op", (op, len(args))))
+        stack.extend(("node", arg) for arg in reversed(args))
+
+    return rendered[0]
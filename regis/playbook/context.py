@@ -3,6 +3,8 @@
 Provides:
 - ``_flatten``         — flatten a nested dict into dot-separated keys
 - ``_build_context``   — build (raw_context, nested_context) from a report
+- ``_refresh_context`` — update a built context after top-level report changes
+- ``_involved_analyzers`` — analyzer names found in tracked ``results.*`` keys
 - ``NamedList``        — list with slug/name-based access
 - ``MissingDataTracker`` — dict that tracks missing-key accesses
 """
@@ -21,12 +23,19 @@ def _flatten(data: dict[str, Any], prefix: str = "") -> dict[str, Any]:
         → {"results.tags.total_tags": 42}
     """
     flat: dict[str, Any] = {}
-    for key, value in data.items():
-        full_key = f"{prefix}.{key}" if prefix else key
-        if isinstance(value, dict):
-            flat.update(_flatten(value, full_key))
-        else:
+    # Explicit stack of (prefix, items iterator) instead of recursion: no
+    # intermediate dicts to merge, and keys keep the depth-first order.
+    stack = [(prefix, iter(data.items()))]
+    while stack:
+        current_prefix, items = stack[-1]
+        for key, value in items:
+            full_key = f"{current_prefix}.{key}" if current_prefix else key
+            if isinstance(value, dict):
+                stack.append((full_key, iter(value.items())))
+                break
             flat[full_key] = value
+        else:
+            stack.pop()
     return flat
 
 
@@ -43,6 +52,35 @@ def _build_context(report: dict[str, Any]) -> tuple[dict[str, Any], dict[str, An
     return raw_context, report
 
 
+def _refresh_context(
+    raw_context: dict[str, Any], report: dict[str, Any], keys: tuple[str, ...]
+) -> None:
+    """Update a context built by ``_build_context`` after *keys* changed in *report*.
+
+    Avoids re-flattening the whole report when only a few top-level entries
+    were replaced. Flat keys left over from the previous values are dropped.
+    """
+    for key in keys:
+        if key in raw_context:
+            prefix = f"{key}."
+            stale = [
+                k for k in raw_context if isinstance(k, str) and k.startswith(prefix)
+            ]
+            for k in stale:
+                del raw_context[k]
+        value = report[key]
+        if isinstance(value, dict):
+            raw_context.update(_flatten(value, key))
+        raw_context[key] = value
+
+
+def _involved_analyzers(accessed_keys: set[str]) -> list[str]:
+    """Return the sorted analyzer names read through ``results.<analyzer>...`` keys."""
+    return sorted(
+        {key.split(".", 2)[1] for key in accessed_keys if key.startswith("results.")}
+    )
+
+
 class NamedList(list):
     """A list wrapper that allows item access by index, slug, or normalized name."""
 
@@ -80,7 +118,14 @@ class NamedList(list):
 
 
 class MissingDataTracker(dict):
-    """A dictionary wrapper that tracks which keys were accessed and if they were missing."""
+    """A dictionary wrapper that tracks which keys were accessed and if they were missing.
+
+    Stays a ``dict`` subclass because json_logic and the custom operators in
+    ``regis.rules.evaluator`` type-check with ``isinstance(x, dict)``; the
+    ``__slots__`` drop the per-instance ``__dict__``.
+    """
+
+    __slots__ = ("_children", "accessed_keys", "missing_accessed", "path", "root")
 
     def __init__(
         self,
@@ -91,6 +136,9 @@ class MissingDataTracker(dict):
         super().__init__(data)
         self.missing_accessed = False
         self.path = path
+        # Child trackers by key: wrapping copies the nested dict, so each
+        # subtree is wrapped once rather than on every access.
+        self._children: dict[Any, MissingDataTracker] = {}
         self.accessed_keys: set[str]  # declared here; assigned in both branches below
         # If this is a nested tracker, use the root tracker's accessed_keys set
         if root_tracker:
@@ -100,29 +148,52 @@ class MissingDataTracker(dict):
             self.root = self
             self.accessed_keys = set()
 
+    def reset(self) -> None:
+        """Clear the missing flag and accessed keys so the tracker can be reused.
+
+        Building a tracker copies the whole context, so callers evaluating many
+        conditions against the same data should create one and reset it between
+        evaluations. The accessed keys set is cleared in place (it is shared
+        with the cached child trackers), so copy it first to keep it.
+        """
+        self.missing_accessed = False
+        self.accessed_keys.clear()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._children.pop(key, None)
+        super().__setitem__(key, value)
+
     def __getitem__(self, key: str) -> Any:
         full_key = f"{self.path}.{key}" if self.path else key
         self.accessed_keys.add(full_key)
-        try:
-            val = super().__getitem__(key)
-        except KeyError:
+        if not dict.__contains__(self, key):
             self.root.missing_accessed = True
-            raise
+            raise KeyError(key)
+        return self._wrap(key, dict.__getitem__(self, key), full_key)
 
+    def get(self, key: str, default: Any = None) -> Any:
+        # Membership check instead of catching KeyError: optional ``var`` lookups
+        # miss often, and raising for each one is comparatively expensive.
+        full_key = f"{self.path}.{key}" if self.path else key
+        self.accessed_keys.add(full_key)
+        if not dict.__contains__(self, key):
+            self.root.missing_accessed = True
+            return default
+        return self._wrap(key, dict.__getitem__(self, key), full_key)
+
+    def _wrap(self, key: Any, val: Any, full_key: str) -> Any:
+        """Flag ``None`` values as missing and wrap nested dicts in a tracker."""
         if val is None:
             self.root.missing_accessed = True
             return None
-
         if isinstance(val, dict):
-            return MissingDataTracker(val, full_key, self.root)
+            child = self._children.get(key)
+            if child is None:
+                child = MissingDataTracker(val, full_key, self.root)
+                self._children[key] = child
+            return child
         return val
 
-    def get(self, key: str, default: Any = None) -> Any:
-        try:
-            return self[key]
-        except KeyError:
-            return default
-
     def __contains__(self, key: object) -> bool:
         if isinstance(key, str):
             full_key = f"{self.path}.{key}" if self.path else key
@@ -13,7 +13,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from regis.playbook.context import NamedList, _build_context
+from regis.playbook.context import NamedList, _build_context, _refresh_context
 from regis.playbook.integrations.gitlab import resolve_gitlab_integration
 from regis.playbook.sections import _evaluate_section, resolve_widgets_final
 from regis.playbook.templates import _resolve_template
@@ -172,8 +172,12 @@ def evaluate(
     - ``sections``       — per-section breakdown (scorecards, levels, display, widgets)
     - ``score``          — overall percentage of scorecards passed (0–100)
     """
+    # The report is flattened once: rules are evaluated against this context and
+    # it is then refreshed with the injected rule results below.
+    raw_context, nested_context = _build_context(report)
+
     # 0. Evaluate rules (merges analyzer defaults with playbook 'rules' section)
-    rules_results = evaluate_rules(report, playbook)
+    rules_results = evaluate_rules(report, playbook, flat_context=raw_context)
 
     # Inject rule results into the report so they are available in context (via dots)
     # NamedList allows lookup by slug (e.g. rules.trivy-no-critical.passed)
@@ -185,7 +189,7 @@ def evaluate(
         "by_tag": rules_results["by_tag"],
     }
 
-    raw_context, nested_context = _build_context(report)
+    _refresh_context(raw_context, report, ("rules", "rules_summary"))
     pages_defs = _normalize_pages(playbook)
     pages_results, total_scorecards_all, total_passed_all = _evaluate_pages(
         pages_defs, raw_context, nested_context
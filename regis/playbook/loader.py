@@ -8,12 +8,18 @@ Supports loading playbook definitions from:
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml-backed safe loader when PyYAML was built with it: same output as
+# SafeLoader, several times faster on large playbooks.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_playbook(path: str | Path) -> dict[str, Any]:
     """Load a playbook definition from a local file, bundle directory, or remote URL."""
@@ -29,16 +35,29 @@ def load_playbook(path: str | Path) -> dict[str, Any]:
             # Infer format from URL or try YAML (which is a superset of JSON)
             if path.lower().endswith(".json"):
                 return json.loads(text)
-            return yaml.safe_load(text)
+            return yaml.load(text, Loader=_YamlLoader)  # nosec B506
         except Exception as exc:
             raise ValueError(f"Failed to download playbook from {path}: {exc}") from exc
 
     path = Path(path)
     if path.is_dir():
         path = path / "playbook.yaml"
-    text = path.read_text(encoding="utf-8")
-    if path.suffix in (".yaml", ".yml"):
-        return yaml.safe_load(text)
+    # The format follows the path as given, not a symlink's target.
+    is_yaml = path.suffix in (".yaml", ".yml")
+    resolved = path.resolve()
+    # Parsed files are cached by (path, format, mtime, size); callers get their
+    # own copy because evaluation normalises rule dicts in place.
+    stat = resolved.stat()
+    parsed = _load_local(str(resolved), is_yaml, stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(parsed)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_local(path: str, is_yaml: bool, mtime_ns: int, size: int) -> Any:
+    """Parse a local playbook file; *mtime_ns* and *size* only key the cache."""
+    text = Path(path).read_text(encoding="utf-8")
+    if is_yaml:
+        return yaml.load(text, Loader=_YamlLoader)  # nosec B506
     return json.loads(text)
 
 
@@ -12,8 +12,9 @@ import logging
 from typing import Any
 
 from regis.playbook.conditions import _stringify_condition
-from regis.playbook.context import MissingDataTracker
+from regis.playbook.context import MissingDataTracker, _involved_analyzers
 from regis.playbook.templates import _resolve_path, _resolve_template
+from regis.rules.compiler import compile_condition, compile_condition_info
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,7 @@ def _evaluate_scorecards(
 ) -> list[dict[str, Any]]:
     """Evaluate each scorecard definition against the raw (flat) context."""
     scorecard_results: list[dict[str, Any]] = []
+    tracker: MissingDataTracker | None = None
     for scorecard in scorecards_defs:
         if scorecard.get("_pre_evaluated"):
             # Use pre-evaluated result
@@ -47,13 +49,21 @@ def _evaluate_scorecards(
             continue
 
         condition = scorecard.get("condition", {})
-        tracker = MissingDataTracker(raw_context)
+        accessed_keys: set[str] = set()
         try:
-            from json_logic import jsonLogic
-
-            result = jsonLogic(condition, tracker)
-            passed = bool(result)
-            incomplete = tracker.missing_accessed
+            compiled, uses_data = compile_condition_info(condition)
+            if uses_data:
+                # Built lazily and reused: constructing a tracker copies raw_context.
+                if tracker is None:
+                    tracker = MissingDataTracker(raw_context)
+                else:
+                    tracker.reset()
+                accessed_keys = tracker.accessed_keys
+                passed = bool(compiled(tracker))
+                incomplete = tracker.missing_accessed
+            else:
+                passed = bool(compiled(raw_context))
+                incomplete = False
         except Exception as exc:  # noqa: BLE001
             logger.warning(
                 "Scorecard '%s' evaluation error: %s",
@@ -65,69 +75,55 @@ def _evaluate_scorecards(
 
         status = "incomplete" if incomplete else ("passed" if passed else "failed")
 
-        involved_analyzers = set()
-        for key in tracker.accessed_keys:
-            if key.startswith("results."):
-                parts = key.split(".")
-                if len(parts) > 1:
-                    involved_analyzers.add(parts[1])
-
         scorecard_results.append(
             {
                 "name": scorecard.get("name", ""),
                 "title": scorecard.get("title", scorecard.get("name", "")),
                 "level": scorecard.get("level"),
                 "tags": scorecard.get("tags", []),
-                "analyzers": sorted(involved_analyzers),
+                "analyzers": _involved_analyzers(accessed_keys),
                 "passed": passed,
                 "status": status,
                 "condition": json.dumps(condition),
-                "details": _stringify_condition(condition, tracker),
+                "details": _stringify_condition(condition, raw_context),
             }
         )
     return scorecard_results
 
 
 def _compute_levels_summary(
-    scorecard_results: list[dict[str, Any]],
+    level_counts: dict[Any, list[int]],
     levels: list[dict[str, Any]],
 ) -> dict[str, Any]:
-    """Build a per-level pass/fail summary from evaluated scorecard results."""
+    """Build a per-level pass/fail summary from ``{level: [passed, total]}`` counts."""
     levels_defined = {
         lv["name"]: lv.get("order", _LEVEL_ORDER.get(lv["name"], 0)) for lv in levels
     }
     levels_summary: dict[str, Any] = {}
-    for level_name in sorted(levels_defined, key=lambda n: levels_defined[n]):
-        level_scorecards = [r for r in scorecard_results if r["level"] == level_name]
-        if level_scorecards:
-            passed_level = sum(1 for r in level_scorecards if r["passed"])
+    for level_name in sorted(levels_defined, key=levels_defined.__getitem__):
+        counts = level_counts.get(level_name)
+        if counts:
+            passed_level, total_level = counts
             levels_summary[level_name] = {
-                "total": len(level_scorecards),
+                "total": total_level,
                 "passed": passed_level,
-                "percentage": round(passed_level / len(level_scorecards) * 100),
+                "percentage": round(passed_level / total_level * 100),
             }
     return levels_summary
 
 
 def _compute_tags_summary(
-    scorecard_results: list[dict[str, Any]],
+    tag_counts: dict[str, list[int]],
 ) -> dict[str, Any]:
-    """Build a per-tag pass/fail summary from evaluated scorecard results."""
-    tags_defined: set[str] = set()
-    for r in scorecard_results:
-        for t in r.get("tags", []):
-            tags_defined.add(t)
-
+    """Build a per-tag pass/fail summary from ``{tag: [passed, total]}`` counts."""
     tags_summary: dict[str, Any] = {}
-    for tag_name in sorted(tags_defined):
-        tag_scorecards = [r for r in scorecard_results if tag_name in r.get("tags", [])]
-        if tag_scorecards:
-            passed_tag = sum(1 for r in tag_scorecards if r["passed"])
-            tags_summary[tag_name] = {
-                "total": len(tag_scorecards),
-                "passed": passed_tag,
-                "percentage": round(passed_tag / len(tag_scorecards) * 100),
-            }
+    for tag_name in sorted(tag_counts):
+        passed_tag, total_tag = tag_counts[tag_name]
+        tags_summary[tag_name] = {
+            "total": total_tag,
+            "passed": passed_tag,
+            "percentage": round(passed_tag / total_tag * 100),
+        }
     return tags_summary
 
 
@@ -147,15 +143,18 @@ def _evaluate_widgets(
 ) -> list[dict[str, Any]]:
     """First-pass widget resolution against raw_context (before full_context exists)."""
     resolved_widgets = []
+    tracker: MissingDataTracker | None = None
     for widget in raw_widgets:
         # Check condition early
         condition = widget.get("condition")
         if condition:
-            tracker = MissingDataTracker(raw_context)
+            # Built lazily and reused: constructing a tracker copies raw_context.
+            if tracker is None:
+                tracker = MissingDataTracker(raw_context)
+            else:
+                tracker.reset()
             try:
-                from json_logic import jsonLogic
-
-                is_active = jsonLogic(condition, tracker)
+                is_active = compile_condition(condition)(tracker)
                 if not is_active and not tracker.missing_accessed:
                     continue
             except Exception as exc:  # noqa: BLE001
@@ -269,14 +268,27 @@ def _evaluate_section(
                 )
 
     scorecard_results = _evaluate_scorecards(scorecards_defs, raw_context)
-    levels_summary = _compute_levels_summary(
-        scorecard_results, section.get("levels", [])
-    )
-    tags_summary = _compute_tags_summary(scorecard_results)
 
-    passed_count = sum(1 for r in scorecard_results if r["passed"])
+    # Single pass over the results for the section score and per-level/tag counts.
+    passed_count = 0
+    level_counts: dict[Any, list[int]] = {}
+    tag_counts: dict[str, list[int]] = {}
+    for r in scorecard_results:
+        passed = 1 if r["passed"] else 0
+        passed_count += passed
+        counts = level_counts.setdefault(r["level"], [0, 0])
+        counts[0] += passed
+        counts[1] += 1
+        # A tag listed twice on one scorecard still counts it once.
+        for tag in dict.fromkeys(r.get("tags", [])):
+            counts = tag_counts.setdefault(tag, [0, 0])
+            counts[0] += passed
+            counts[1] += 1
     total = len(scorecard_results)
 
+    levels_summary = _compute_levels_summary(level_counts, section.get("levels", []))
+    tags_summary = _compute_tags_summary(tag_counts)
+
     section_result: dict[str, Any] = {
         "name": section.get("name", ""),
         "score": round(passed_count / total * 100) if total else 0,
@@ -317,8 +329,6 @@ def resolve_widgets_final(
     This pass also re-evaluates widget conditions and filters out inactive widgets.
     Mutates ``pages`` in-place.
     """
-    from json_logic import jsonLogic
-
     for page in pages:
         filtered_sections = []
         for section in page["sections"]:
@@ -326,7 +336,7 @@ def resolve_widgets_final(
             condition = section.get("condition")
             if condition:
                 try:
-                    if not jsonLogic(condition, full_context):
+                    if not compile_condition(condition)(full_context):
                         continue
                 except Exception:  # noqa: BLE001
                     continue
@@ -336,7 +346,7 @@ def resolve_widgets_final(
                 w_condition = widget.get("condition")
                 if w_condition:
                     try:
-                        if not jsonLogic(w_condition, full_context):
+                        if not compile_condition(w_condition)(full_context):
                             continue
                     except Exception:  # noqa: BLE001
                         continue
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import importlib.metadata
 import json
 from datetime import datetime, timezone
@@ -9,7 +10,16 @@ from importlib import resources
 from typing import Any
 
 import click
-from jinja2 import BaseLoader, Environment
+from jinja2 import BaseLoader, Environment, Template
+
+
+@functools.lru_cache(maxsize=1)
+def _get_template() -> Template:
+    """Load and compile the single-file report template once per process."""
+    tmpl_path = resources.files("regis") / "templates" / "html" / "report.html.j2"
+    tmpl_content = tmpl_path.read_text(encoding="utf-8")
+    env = Environment(autoescape=True, loader=BaseLoader())
+    return env.from_string(tmpl_content)
 
 
 def render_html_single(report: dict[str, Any], sections: str = "all") -> str:
@@ -36,13 +46,7 @@ def render_html_single(report: dict[str, Any], sections: str = "all") -> str:
         for slug in sorted(filter_slugs - available):
             click.echo(f"  Warning: unknown section '{slug}' (ignored)", err=True)
 
-    # Load template from package resources
-    tmpl_path = resources.files("regis") / "templates" / "html" / "report.html.j2"
-    tmpl_content = tmpl_path.read_text(encoding="utf-8")
-
-    env = Environment(autoescape=True, loader=BaseLoader())
-
-    template = env.from_string(tmpl_content)
+    template = _get_template()
 
     # Build image_ref string
     req = report.get("request", {})
@@ -0,0 +1,299 @@
+"""Compile JsonLogic conditions into Python closures.
+
+``jsonLogic(condition, data)`` re-walks the condition tree on every call:
+for each node it checks the node shape, extracts the operator, normalises the
+arguments and probes several operator tables before dispatching.  Rules and
+scorecards are evaluated with the same conditions over and over, so this module
+does that work once and returns a closure that only performs the operations.
+
+The closures reuse json_logic's own operator implementations (including the
+regis custom operators registered in ``regis.rules.evaluator``), so results are
+identical to ``jsonLogic``.  ``and``, ``or`` and ``if`` short-circuit
+exactly like the interpreter, so keys in branches that are never taken are
+not read (and not reported as missing).  Subtrees that read no data, such as
+``{"*": [60, 60, 24]}``, are evaluated once at compile time.  Nodes the
+compiler does not handle natively (scoped operators such as ``some``/``all``,
+dotted method calls and the deprecated ``count``) fall back to ``jsonLogic``
+for their subtree.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+from typing import Any
+
+import json_logic
+from json_logic import jsonLogic
+
+from regis.playbook.context import MissingDataTracker
+
+CompiledCondition = Callable[[Any], Any]
+
+# Operators that manage their own data scope or are deliberately left to the
+# interpreter (e.g. ``count`` emits a deprecation warning there).
+_INTERPRETED_OPS = frozenset(
+    {"filter", "map", "reduce", "all", "none", "some", "count"}
+)
+
+# Operators that receive the data object as their first argument.
+_DATA_OPS = frozenset({"var", "missing", "missing_some"})
+
+# Operators whose result depends on the data object.
+_READ_OPS = _DATA_OPS | _INTERPRETED_OPS
+
+# Operators never pre-computed: on top of data reads, ``log`` logs and
+# ``method`` calls arbitrary methods on its argument.
+_UNFOLDABLE_OPS = _READ_OPS | {"log", "method"}
+
+# Folded results are shared by every call, so only immutable ones are kept.
+_FOLDABLE_TYPES = (bool, int, float, str, type(None))
+
+_COMPILED: dict[str, tuple[CompiledCondition, bool]] = {}
+_COMPILED_MAX = 1024
+
+
+def compile_condition(condition: Any) -> CompiledCondition:
+    """Return a callable equivalent to ``lambda data: jsonLogic(condition, data)``.
+
+    Compiled closures are cached by the ``repr`` of *condition*, so equal
+    conditions coming from different rule dicts share one compilation.
+    """
+    return compile_condition_info(condition)[0]
+
+
+def reads_data(condition: Any) -> bool:
+    """Return True if evaluating *condition* may read from the data object.
+
+    Conservative: scoped, interpreted and unknown operators count as reads.
+    Conditions for which this is False can be evaluated against the plain
+    context, skipping ``MissingDataTracker`` bookkeeping altogether.  The
+    answer is computed once and cached with the compiled condition.
+    """
+    return compile_condition_info(condition)[1]
+
+
+def compile_condition_info(condition: Any) -> tuple[CompiledCondition, bool]:
+    """Return ``(compile_condition(c), reads_data(c))`` with a single cache lookup."""
+    key = repr(condition)
+    entry = _COMPILED.get(key)
+    if entry is None:
+        if len(_COMPILED) >= _COMPILED_MAX:
+            _COMPILED.clear()
+        # Compile a private copy so later mutation of the caller's dict cannot
+        # leak into the cached closure's constants.
+        private = copy.deepcopy(condition)
+        entry = (
+            _with_data_default(_compile(private)),
+            _uses_ops(private, _READ_OPS),
+        )
+        _COMPILED[key] = entry
+    return entry
+
+
+def _uses_ops(logic: Any, ops: frozenset[str]) -> bool:
+    """Return True if *logic* uses any of *ops* or an operator json_logic lacks."""
+    if isinstance(logic, (list, tuple)):
+        return any(_uses_ops(item, ops) for item in logic)
+    if not (isinstance(logic, dict) and len(logic) == 1):
+        return False
+    op = next(iter(logic))
+    if op in ops or op not in json_logic.operations:
+        return True
+    return _uses_ops(logic[op], ops)
+
+
+def _with_data_default(fn: CompiledCondition) -> CompiledCondition:
+    # jsonLogic substitutes an empty dict for falsy data before evaluating.
+    def run(data: Any = None) -> Any:
+        return fn(data or {})
+
+    return run
+
+
+def _constant(value: Any) -> CompiledCondition:
+    return lambda data: value
+
+
+def _interpreted(logic: Any) -> CompiledCondition:
+    return lambda data: jsonLogic(logic, data)
+
+
+def _compile(logic: Any) -> CompiledCondition:
+    """Compile a JsonLogic node (assumes data has already been defaulted)."""
+    if isinstance(logic, (list, tuple)):
+        items = [_compile(item) for item in logic]
+        return lambda data: [item(data) for item in items]
+
+    if not (isinstance(logic, dict) and len(logic) == 1):
+        return _constant(logic)
+
+    op = str(next(iter(logic)))
+    if op not in logic:
+        # Non-string operator key: let jsonLogic raise its usual error.
+        return _interpreted(logic)
+    if not _uses_ops(logic, _UNFOLDABLE_OPS):
+        folded = _fold(logic)
+        if folded is not None:
+            return folded
+
+    values = logic[op]
+    if not isinstance(values, (list, tuple)):
+        values = [values]
+
+    if op == "and":
+        return _compile_and([_compile(v) for v in values])
+    if op == "or":
+        return _compile_or([_compile(v) for v in values])
+    if op == "if" or (op == "?:" and len(values) == 3):
+        return _compile_if([_compile(v) for v in values])
+    if op in _INTERPRETED_OPS or op == "?:":
+        return _interpreted(logic)
+
+    if op == "var" and len(values) <= 2 and not any(_is_node(v) for v in values):
+        return _compile_var(*values)
+
+    args = [_compile(v) for v in values]
+
+    if op in _DATA_OPS:
+        data_fn = json_logic.operations[op]
+        return lambda data: data_fn(data, *[arg(data) for arg in args])
+
+    fn = json_logic.operations.get(op)
+    if fn is None:
+        # Dotted method calls or unknown operators.
+        return _interpreted(logic)
+
+    if len(args) == 1:
+        (a,) = args
+        return lambda data: fn(a(data))
+    if len(args) == 2:
+        a, b = args
+        return lambda data: fn(a(data), b(data))
+    return lambda data: fn(*[arg(data) for arg in args])
+
+
+def _fold(logic: Any) -> CompiledCondition | None:
+    """Pre-compute a data-independent node, or return None if it cannot be."""
+    try:
+        value = jsonLogic(logic, {})
+    except Exception:  # noqa: BLE001
+        # Leave the node compiled so the error surfaces at evaluation time.
+        return None
+    if not isinstance(value, _FOLDABLE_TYPES):
+        return None
+    return _constant(value)
+
+
+def _is_node(value: Any) -> bool:
+    """Return True if *value* is evaluated by jsonLogic rather than used as is."""
+    return isinstance(value, (list, tuple)) or (
+        isinstance(value, dict) and len(value) == 1
+    )
+
+
+def _compile_var(var_name: Any = None, default: Any = None) -> CompiledCondition:
+    """Compile ``{"var": ...}`` with a constant path, splitting it only once.
+
+    Mirrors json_logic's ``_var``: each segment is tried as a key, then as an
+    integer index; a lookup failure returns *default*.
+    """
+    if var_name is None or var_name == "":
+        return lambda data: data
+    keys = str(var_name).split(".")
+    tracked = _compile_tracked_var(keys, default)
+
+    def _var(data: Any) -> Any:
+        if isinstance(data, MissingDataTracker) and not data.path:
+            return tracked(data)
+        try:
+            for key in keys:
+                try:
+                    data = data[key]
+                except TypeError:
+                    data = data[int(key)]
+        except (KeyError, TypeError, ValueError):
+            return default
+        return data
+
+    return _var
+
+
+def _compile_tracked_var(keys: list[str], default: Any) -> CompiledCondition:
+    """Variant of ``_compile_var`` for a root ``MissingDataTracker``.
+
+    Walks the underlying dicts directly instead of through the tracker's
+    ``__getitem__``, which would copy every intermediate dict into a child
+    tracker and format its dotted path.  Accessed keys and the missing flag
+    are recorded exactly as the tracker would, using paths built up front;
+    only a dict result is wrapped, so operators applied to it keep tracking.
+    """
+    paths = [".".join(keys[: i + 1]) for i in range(len(keys))]
+
+    def _var(tracker: MissingDataTracker) -> Any:
+        root = tracker.root
+        accessed_keys = tracker.accessed_keys
+        data: Any = tracker
+        # The tracker only sees lookups along an unbroken chain of dicts.
+        tracking = True
+        try:
+            for path, key in zip(paths, keys, strict=True):
+                if tracking and isinstance(data, dict):
+                    accessed_keys.add(path)
+                    if not dict.__contains__(data, key):
+                        root.missing_accessed = True
+                        return default
+                    data = dict.__getitem__(data, key)
+                    if data is None:
+                        root.missing_accessed = True
+                    continue
+                tracking = False
+                try:
+                    data = data[key]
+                except TypeError:
+                    data = data[int(key)]
+        except (KeyError, TypeError, ValueError):
+            return default
+        if tracking and isinstance(data, dict):
+            return MissingDataTracker(data, paths[-1], root)
+        return data
+
+    return _var
+
+
+def _compile_and(args: list[CompiledCondition]) -> CompiledCondition:
+    def _and(data: Any) -> Any:
+        current: Any = False
+        for arg in args:
+            current = arg(data)
+            if not current:
+                return current
+        return current
+
+    return _and
+
+
+def _compile_or(args: list[CompiledCondition]) -> CompiledCondition:
+    def _or(data: Any) -> Any:
+        current: Any = False
+        for arg in args:
+            current = arg(data)
+            if current:
+                return current
+        return current
+
+    return _or
+
+
+def _compile_if(args: list[CompiledCondition]) -> CompiledCondition:
+    """Compile ``if``/``?:``: only the selected branch is ever evaluated."""
+    pairs = [(args[i], args[i + 1]) for i in range(0, len(args) - 1, 2)]
+    otherwise = args[-1] if len(args) % 2 else None
+
+    def _if(data: Any) -> Any:
+        for cond, then in pairs:
+            if cond(data):
+                return then(data)
+        return otherwise(data) if otherwise is not None else None
+
+    return _if
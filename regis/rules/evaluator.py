@@ -7,12 +7,19 @@ import re
 from typing import Any
 
 import json_logic
-from json_logic import jsonLogic
 
-from regis.playbook.context import MissingDataTracker, _build_context
+from regis.playbook.context import (
+    MissingDataTracker,
+    _build_context,
+    _involved_analyzers,
+)
+from regis.rules.compiler import compile_condition
 
 logger = logging.getLogger(__name__)
 
+# Marks a context that had no "rule" entry before rules were injected.
+_NO_RULE = object()
+
 # Pattern for interpolating ${path.to.var}
 # Uses [^${}]+ to match only innermost expressions (no nested braces/dollars),
 # enabling multi-pass resolution of nested patterns like ${outer.${inner}}.
@@ -311,15 +318,21 @@ _add_custom_operations()
 
 
 def evaluate_rules(
-    report: dict[str, Any], rules_def: dict[str, Any] | None = None
+    report: dict[str, Any],
+    rules_def: dict[str, Any] | None = None,
+    flat_context: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Evaluate a set of rules against the analysis report.
 
     Args:
         report: The analysis report dict.
         rules_def: Optional parsed rules.yaml.
+        flat_context: Optional context already built from *report* with
+            ``_build_context``; its ``rule`` entry is restored on return.
     """
-    flat_context, _ = _build_context(report)
+    if flat_context is None:
+        flat_context, _ = _build_context(report)
+    previous_rule = flat_context.get("rule", _NO_RULE)
 
     request_info = report.get("request", {})
     analyzers_present = request_info.get("analyzers", [])
@@ -337,15 +350,20 @@ def evaluate_rules(
     # Filter out disabled rules first
     enabled_rules = [r for r in final_rules if r.get("enable", True)]
 
+    # A single tracker is reused across rules: building one copies the whole
+    # flattened context, which would otherwise happen once per rule.
+    tracker = MissingDataTracker(flat_context)
+
     for rule in enabled_rules:
         # Inject the current rule into the flattened context
         # This makes it accessible via e.g. {"var": "rule.params.max_days"}
         flat_context["rule"] = rule
+        tracker["rule"] = rule
+        tracker.reset()
 
         condition = rule.get("condition", {})
-        tracker = MissingDataTracker(flat_context)
         try:
-            passed = bool(jsonLogic(condition, tracker))
+            passed = bool(compile_condition(condition)(tracker))
         except Exception as exc:  # noqa: BLE001
             logger.warning(
                 "Rule '%s' evaluation error: %s", rule.get("slug", "unknown"), exc
@@ -362,13 +380,6 @@ def evaluate_rules(
         message_tmpl = messages.get("pass" if passed else "fail", "")
         message_resolved = _interpolate_string(message_tmpl, flat_context)
 
-        involved_analyzers = set()
-        for key in tracker.accessed_keys:
-            if key.startswith("results."):
-                parts = key.split(".")
-                if len(parts) > 1:
-                    involved_analyzers.add(parts[1])
-
         results.append(
             {
                 "slug": rule.get("slug", ""),
@@ -378,10 +389,15 @@ def evaluate_rules(
                 "passed": passed,
                 "status": status,
                 "message": message_resolved,
-                "analyzers": sorted(involved_analyzers),
+                "analyzers": _involved_analyzers(tracker.accessed_keys),
             }
         )
 
+    if previous_rule is _NO_RULE:
+        flat_context.pop("rule", None)
+    else:
+        flat_context["rule"] = previous_rule
+
     # Sort results to be deterministic: failures first over passes, then by level, then slug
     # Levels ordered by severity
     level_order = {"critical": 1, "warning": 2, "info": 3, "none": 4}
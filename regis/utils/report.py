@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import webbrowser
@@ -211,6 +212,27 @@ def run_playbooks(
 
 def validate_report(report: dict[str, Any]) -> None:
     """Validate a final report against its schema."""
+    registry, report_schema = _load_schema_registry()
+
+    if report_schema:
+        from jsonschema.validators import validator_for
+
+        try:
+            validator_cls = validator_for(report_schema)
+            validator = validator_cls(report_schema, registry=registry)
+            validator.validate(instance=report)
+        except jsonschema.ValidationError as exc:
+            raise click.ClickException(
+                f"Report schema validation failed: {exc.message}"
+            ) from exc
+
+
+@functools.cache
+def _load_schema_registry() -> tuple[Any, dict[str, Any] | None]:
+    """Load the bundled schemas once into a referencing registry.
+
+    Returns the registry and the ``report.schema.json`` contents (or None).
+    """
     from referencing import Registry, Resource
 
     schemas_dir = resources.files("regis.schemas")
@@ -245,17 +267,7 @@ def validate_report(report: dict[str, Any]) -> None:
         if schema_file.name == "report.schema.json":
             report_schema = schema_data
 
-    if report_schema:
-        from jsonschema.validators import validator_for
-
-        try:
-            validator_cls = validator_for(report_schema)
-            validator = validator_cls(report_schema, registry=registry)
-            validator.validate(instance=report)
-        except jsonschema.ValidationError as exc:
-            raise click.ClickException(
-                f"Report schema validation failed: {exc.message}"
-            ) from exc
+    return registry, report_schema
 
 
 def _render_markdown(report: dict[str, Any]) -> str:
@@ -1,6 +1,10 @@
 """Tests for render_html_single in regis.report.html."""
 
-from regis.report.html import render_html_single
+from unittest.mock import patch
+
+from jinja2 import Environment
+
+from regis.report.html import _get_template, render_html_single
 
 
 def _minimal_report(**extra) -> dict:
@@ -120,3 +124,10 @@ class TestRenderHtmlSingle:
     def test_footer_contains_generated_by(self):
         html = render_html_single(_minimal_report())
         assert "Generated by regis" in html
+
+    def test_template_compiled_once(self):
+        _get_template.cache_clear()
+        with patch("regis.report.html.Environment", wraps=Environment) as env:
+            render_html_single(_minimal_report())
+            render_html_single(_minimal_report())
+        assert env.call_count == 1
@@ -23,16 +23,32 @@ class TestDiscoverAnalyzers:
 
     def test_skips_failed_entry_points(self) -> None:
         """A broken entry point is logged and skipped, not raised."""
-        from regis.analyzers.discovery import discover_analyzers
+        from regis.analyzers.discovery import _load_analyzers, discover_analyzers
 
         bad_ep = MagicMock()
         bad_ep.name = "broken"
         bad_ep.load.side_effect = ImportError("missing dep")
 
-        with patch("regis.analyzers.discovery.entry_points", return_value=[bad_ep]):
-            result = discover_analyzers()
+        _load_analyzers.cache_clear()
+        try:
+            with patch("regis.analyzers.discovery.entry_points", return_value=[bad_ep]):
+                result = discover_analyzers()
+        finally:
+            _load_analyzers.cache_clear()
 
         assert "broken" not in result
+        bad_ep.load.assert_called_once()
+
+    def test_entry_points_scanned_once(self) -> None:
+        from regis.analyzers.discovery import discover_analyzers
+
+        first = discover_analyzers()
+        with patch("regis.analyzers.discovery.entry_points") as mock_eps:
+            second = discover_analyzers()
+
+        mock_eps.assert_not_called()
+        assert second == first
+        assert second is not first
 
 
 class TestRunCmd:
@@ -61,3 +77,33 @@ class TestSchemaValidation:
         }
         with pytest.raises(AnalyzerError):
             analyzer.validate(bad_report)
+
+    def test_reports_best_match_error(self):
+        analyzer = SkopeoAnalyzer()
+        with pytest.raises(AnalyzerError, match="'repository' is a required property"):
+            analyzer.validate({"analyzer": "skopeo", "tag": "latest", "platforms": []})
+
+    def test_validator_is_built_once_per_schema(self):
+        from regis.analyzers.base import _VALIDATORS
+
+        _VALIDATORS.clear()
+        analyzer = SkopeoAnalyzer()
+        with patch.object(
+            SkopeoAnalyzer, "_load_schema", wraps=analyzer._load_schema
+        ) as load:
+            for _ in range(3):
+                with pytest.raises(AnalyzerError):
+                    analyzer.validate({})
+        assert load.call_count == 1
+
+    def test_load_schema_override_is_used(self):
+        class CustomSchemaAnalyzer(SkopeoAnalyzer):
+            schema_file = "custom.schema.json"
+
+            def _load_schema(self):
+                return {"type": "object", "required": ["custom"]}
+
+        analyzer = CustomSchemaAnalyzer()
+        analyzer.validate({"custom": 1})
+        with pytest.raises(AnalyzerError, match="'custom' is a required property"):
+            analyzer.validate({})
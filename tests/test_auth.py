@@ -117,7 +117,7 @@ class TestRegistryAuth:
             "REGIS_PASSWORD": "env_password",
         }
 
-        with patch.dict(os.environ, env):
+        with runner.isolated_filesystem(), patch.dict(os.environ, env):
             result = runner.invoke(main, ["analyze", "nginx", "-a", "test_analyzer"])
 
         assert result.exit_code == 0
@@ -202,17 +202,18 @@ class TestRegistryAuth:
         mock_discover.return_value = {"test_analyzer": mock_analyzer_cls}
         mock_client_cls.return_value.get_digest.return_value = None
 
-        result = runner.invoke(
-            main,
-            [
-                "analyze",
-                "registry.example.com/library/nginx",
-                "-a",
-                "test_analyzer",
-                "--auth",
-                "registry.example.com=override_user:override_pass",
-            ],
-        )
+        with runner.isolated_filesystem():
+            result = runner.invoke(
+                main,
+                [
+                    "analyze",
+                    "registry.example.com/library/nginx",
+                    "-a",
+                    "test_analyzer",
+                    "--auth",
+                    "registry.example.com=override_user:override_pass",
+                ],
+            )
 
         assert result.exit_code == 0
 
@@ -3,6 +3,7 @@ import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
+import responses
 
 from regis.analyzers.base import AnalyzerError
 from regis.analyzers.hadolint import HadolintAnalyzer
@@ -93,6 +94,7 @@ class TestHadolintCoverage:
 
 
 class TestScorecardCoverage:
+    @responses.activate
     def test_flow(self):
         cl = MagicMock()
         cl.get_manifest.side_effect = [
@@ -105,14 +107,19 @@ class TestScorecardCoverage:
             }
         }
         assert _resolve_source_repo(cl, "r", "tag") == "https://github.com/a/b"
-        with patch("requests.get") as g:
-            g.return_value = MagicMock(status_code=200)
-            g.return_value.json.return_value = {
-                "full_description": "Git at https://github.com/f/b"
-            }
-            assert "f/b" in _source_repo_from_dockerhub("r")
-            g.return_value.status_code = 401
-            assert _fetch_scorecard("gh", "o", "r") is None
+        responses.add(
+            responses.GET,
+            "https://hub.docker.com/v2/repositories/r",
+            json={"full_description": "Git at https://github.com/f/b"},
+        )
+        assert "f/b" in _source_repo_from_dockerhub("r")
+        responses.add(
+            responses.GET,
+            "https://api.securityscorecards.dev/projects/gh/o/r",
+            status=401,
+        )
+        assert _fetch_scorecard("gh", "o", "r") is None
+        assert len(responses.calls) == 2
 
 
 class TestSizeCoverage:
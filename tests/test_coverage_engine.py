@@ -1,3 +1,6 @@
+import pytest
+
+from regis.playbook.context import _involved_analyzers
 from regis.playbook.engine import (
     MissingDataTracker,
     _format_date,
@@ -10,11 +13,17 @@ from regis.playbook.engine import (
 )
 
 
-def test_date_format_errors():
-    assert _format_date("invalid") == "invalid"
-    assert _format_datetime("invalid") == "invalid"
-    assert _format_time("invalid") == "invalid"
-    assert _format_date(None) is None
+@pytest.mark.parametrize(
+    ("fn", "value", "expected"),
+    [
+        (_format_date, "invalid", "invalid"),
+        (_format_datetime, "invalid", "invalid"),
+        (_format_time, "invalid", "invalid"),
+        (_format_date, None, None),
+    ],
+)
+def test_date_format_errors(fn, value, expected):
+    assert fn(value) == expected
 
 
 def test_resolve_template_edge_cases():
@@ -24,23 +33,22 @@ def test_resolve_template_edge_cases():
     assert _resolve_template("{{ invalid.unclosed", {}) == "{{ invalid.unclosed"
 
 
-def test_resolve_path_edge_cases():
-    # Non-string input
-    assert _resolve_path(123, {}) == 123
-
-    # Jinja2 in path error - it might return the template string or a string representation of the error
-    # but strictly it returns template_str on exception in _resolve_path
-    assert (
-        _resolve_path("{{ invalid() }}", {"invalid": lambda: 1 / 0})
-        == "{{ invalid() }}"
-    )
-
-    # Path traversal edge cases
-    context = {"a": {"b": [10, 20]}}
-    assert _resolve_path("a..b", context) == [10, 20]  # skips empty parts
-    assert _resolve_path("a.b.string", context) is None  # non-integer index for list
-    assert _resolve_path("a.b.99", context) is None  # out of bounds
-    assert _resolve_path("a.b.0.deep", context) is None  # too deep on scalar
+@pytest.mark.parametrize(
+    ("path", "context", "expected"),
+    [
+        # Non-string input
+        (123, {}, 123),
+        # Jinja2 error in path: the template string is returned as is
+        ("{{ invalid() }}", {"invalid": lambda: 1 / 0}, "{{ invalid() }}"),
+        # Path traversal edge cases
+        ("a..b", {"a": {"b": [10, 20]}}, [10, 20]),  # skips empty parts
+        ("a.b.string", {"a": {"b": [10, 20]}}, None),  # non-integer list index
+        ("a.b.99", {"a": {"b": [10, 20]}}, None),  # out of bounds
+        ("a.b.0.deep", {"a": {"b": [10, 20]}}, None),  # too deep on scalar
+    ],
+)
+def test_resolve_path_edge_cases(path, context, expected):
+    assert _resolve_path(path, context) == expected
 
 
 def test_missing_data_tracker_none_and_contains():
@@ -60,6 +68,63 @@ def test_missing_data_tracker_none_and_contains():
     assert 123 not in tracker
 
 
+def test_missing_data_tracker_get_and_getitem_missing():
+    tracker = MissingDataTracker({"a": {"b": 1}})
+
+    assert tracker.get("missing", "default") == "default"
+    assert tracker.missing_accessed is True
+
+    tracker.missing_accessed = False
+    nested = tracker.get("a")
+    assert isinstance(nested, MissingDataTracker)
+    assert nested.get("b") == 1
+    assert tracker.missing_accessed is False
+
+    with pytest.raises(KeyError):
+        nested["c"]
+    assert tracker.missing_accessed is True
+    assert tracker.accessed_keys == {"missing", "a", "a.b", "a.c"}
+
+
+def test_missing_data_tracker_is_slotted_dict():
+    tracker = MissingDataTracker({"a": 1})
+
+    assert isinstance(tracker, dict)
+    assert not hasattr(tracker, "__dict__")
+
+
+def test_missing_data_tracker_reset():
+    tracker = MissingDataTracker({"a": {"b": 1}})
+    assert tracker.get("missing") is None
+    assert tracker["a"]["b"] == 1
+
+    tracker.reset()
+
+    assert tracker.missing_accessed is False
+    assert tracker.accessed_keys == set()
+    assert tracker["a"]["b"] == 1
+    assert tracker.accessed_keys == {"a", "a.b"}
+
+
+def test_missing_data_tracker_reuses_child_trackers():
+    tracker = MissingDataTracker({"a": {"b": {"c": 1}}})
+    child = tracker["a"]
+    assert tracker.get("a") is child
+    assert child["b"] is child["b"]
+
+    tracker["a"] = {"b": 2}
+    assert tracker["a"]["b"] == 2
+
+    tracker.reset()
+    assert tracker["a"]["b"] == 2
+    assert tracker.accessed_keys == {"a", "a.b"}
+
+
+def test_involved_analyzers():
+    keys = {"results", "results.trivy", "results.trivy.a.b", "results.sbom", "rule.x"}
+    assert _involved_analyzers(keys) == ["sbom", "trivy"]
+
+
 def test_stringify_condition_edge_cases():
     assert _stringify_condition(None, {}) == "MISSING"
     assert _stringify_condition(123, {}) == "123"
@@ -73,6 +138,15 @@ def test_stringify_condition_edge_cases():
     assert _stringify_condition({"or": [True, False]}, {}) == "(True) or (False)"
 
 
+def test_stringify_condition_deeply_nested():
+    condition: object = {"var": "a"}
+    for _ in range(5000):
+        condition = {"!": [condition]}
+    rendered = _stringify_condition(condition, {"a": 1})
+    assert rendered.startswith("!(!(")
+    assert "a (1)" in rendered
+
+
 def test_evaluate_errors_and_edge_cases(caplog):
     # jsonLogic error in scorecard
     playbook = {
@@ -6,7 +6,9 @@ from typing import Any
 
 import yaml
 
+from regis.playbook.context import _build_context, _refresh_context
 from regis.playbook.engine import _flatten, evaluate, load_playbook
+from regis.playbook.sections import _evaluate_widgets
 
 
 class TestFlatten:
@@ -20,6 +22,27 @@ class TestFlatten:
     def test_empty(self):
         assert _flatten({}) == {}
 
+    def test_preserves_depth_first_order(self):
+        data = {"a": {"b": {"c": 1}, "d": 2, "e": {}}, "f": 3}
+        assert list(_flatten(data)) == ["a.b.c", "a.d", "f"]
+
+    def test_prefix(self):
+        assert _flatten({"x": {"y": 1}}, "p") == {"p.x.y": 1}
+
+
+class TestRefreshContext:
+    """Test the ``_refresh_context`` helper."""
+
+    def test_matches_rebuilt_context(self):
+        report = {"results": {"a": 1}, "summary": {"old": {"x": 1}, "kept": 2}}
+        raw_context, _ = _build_context(report)
+
+        report["summary"] = {"kept": 3, "new": {"y": 4}}
+        report["rules"] = [{"slug": "r"}]
+        _refresh_context(raw_context, report, ("summary", "rules"))
+
+        assert raw_context == _build_context(report)[0]
+
 
 class TestLoadPlaybook:
     """Test playbook loading."""
@@ -149,6 +172,51 @@ class TestEvaluate:
         result = evaluate(self.PLAYBOOK, report)
         assert result["passed_scorecards"] == 2
 
+    def test_details_for_passing_scorecard(self):
+        report = {
+            "results": {
+                "tags": {"total_tags": 50},
+                "provenance": {"has_provenance": True},
+                "playbookdev": {"score": 8},
+            },
+        }
+        result = evaluate(self.PLAYBOOK, report)
+        scorecards = result["pages"][0]["sections"][0]["scorecards"]
+        assert scorecards[0]["details"] == "results.tags.total_tags (50) > 0"
+
+    def test_levels_summary(self):
+        report = {
+            "results": {
+                "tags": {"total_tags": 50},
+                "provenance": {"has_provenance": True},
+                "playbookdev": {"score": 3},
+            },
+        }
+        result = evaluate(self.PLAYBOOK, report)
+        summary = result["pages"][0]["sections"][0]["levels_summary"]
+        assert list(summary) == ["bronze", "silver", "gold"]
+        assert summary["silver"] == {"total": 1, "passed": 1, "percentage": 100}
+        assert summary["gold"] == {"total": 1, "passed": 0, "percentage": 0}
+
+    def test_tags_summary(self):
+        playbook = {
+            "sections": [
+                {
+                    "name": "Main",
+                    "scorecards": [
+                        {"name": "a", "tags": ["sec", "ops"], "condition": True},
+                        {"name": "b", "tags": ["sec", "sec"], "condition": False},
+                        {"name": "c", "condition": True},
+                    ],
+                }
+            ]
+        }
+        result = evaluate(playbook, {"results": {}})
+        summary = result["pages"][0]["sections"][0]["tags_summary"]
+        assert list(summary) == ["ops", "sec"]
+        assert summary["ops"] == {"total": 1, "passed": 1, "percentage": 100}
+        assert summary["sec"] == {"total": 2, "passed": 1, "percentage": 50}
+
     def test_tags_propagation(self):
         """Test that tags are correctly copied from scorecard defs to results."""
         playbook = {
@@ -319,6 +387,18 @@ class TestEvaluate:
         assert widgets[2]["label"] == "W2"
         assert widgets[2]["resolved_value"] == "B"
 
+    def test_widget_conditions_first_pass(self):
+        """Inactive widgets are dropped unless their condition hit missing data."""
+        raw_widgets = [
+            {"label": "on", "condition": {"==": [{"var": "results.x"}, 1]}},
+            {"label": "off", "condition": {"==": [{"var": "results.x"}, 2]}},
+            {"label": "unknown", "condition": {"var": "results.missing"}},
+            {"label": "off-again", "condition": {"!": {"var": "results.x"}}},
+        ]
+        raw_context, nested_context = _build_context({"results": {"x": 1}})
+        widgets = _evaluate_widgets(raw_widgets, raw_context, nested_context)
+        assert [w["label"] for w in widgets] == ["on", "unknown"]
+
 
 class TestGitLabChecklist:
     """Test GitLab MR description checklist item evaluation."""
@@ -130,3 +130,33 @@ class TestLoadPlaybookBundle:
         f.write_text(json.dumps(MINIMAL_PLAYBOOK))
         loaded = load_playbook(f)
         assert loaded["name"] == "Bundle Playbook"
+
+
+class TestLoadPlaybookCache:
+    """Test the (path, mtime, size) parse cache behind load_playbook()."""
+
+    def test_repeated_loads_return_independent_copies(self, tmp_path):
+        f = tmp_path / "playbook.yaml"
+        f.write_text(yaml.dump(MINIMAL_PLAYBOOK))
+        first = load_playbook(f)
+        first["name"] = "mutated"
+        assert load_playbook(f)["name"] == "Bundle Playbook"
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        f = tmp_path / "playbook.yaml"
+        f.write_text(yaml.dump(MINIMAL_PLAYBOOK))
+        assert load_playbook(f)["name"] == "Bundle Playbook"
+        f.write_text(yaml.dump({**MINIMAL_PLAYBOOK, "name": "Changed name"}))
+        assert load_playbook(f)["name"] == "Changed name"
+
+    def test_symlink_format_follows_link_suffix(self, tmp_path):
+        target = tmp_path / "target_file"
+        target.write_text(yaml.dump(MINIMAL_PLAYBOOK))
+        link = tmp_path / "pb.yaml"
+        link.symlink_to(target)
+        assert load_playbook(link)["name"] == "Bundle Playbook"
+
+    def test_matches_pure_python_safe_loader(self):
+        default = Path(__file__).parent.parent / "regis" / "playbooks" / "default"
+        text = (default / "playbook.yaml").read_text(encoding="utf-8")
+        assert load_playbook(default) == yaml.safe_load(text)
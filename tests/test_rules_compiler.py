@@ -0,0 +1,193 @@
+"""Tests for the JsonLogic condition compiler."""
+
+import datetime
+import logging
+from unittest.mock import patch
+
+import json_logic
+import pytest
+from json_logic import jsonLogic
+
+import regis.rules.evaluator  # noqa: F401  (registers custom operators)
+from regis.playbook.context import MissingDataTracker
+from regis.rules.compiler import compile_condition, reads_data
+
+DATA = {
+    "request": {"registry": "docker.io"},
+    "results": {
+        "trivy": {"critical_count": 0, "high_count": 3, "fixed_count": None},
+        "skopeo": {"labels": {"maintainer": "me"}, "env": ["A=1", "DEBUG=1"]},
+        "tags": ["1.0", "1.1", "latest"],
+        "platforms": [{"os": "linux", "labels": {"a": "1"}}],
+    },
+    "rule": {"params": {"max_count": 2, "domains": ["docker.io", "quay.io"]}},
+}
+
+CONDITIONS = [
+    {"==": [{"var": "results.trivy.critical_count"}, 0]},
+    {"<=": [{"var": "results.trivy.high_count"}, {"var": "rule.params.max_count"}]},
+    {"in": [{"var": "request.registry"}, {"var": "rule.params.domains"}]},
+    {"!": {"var": "results.trivy.fixed_count"}},
+    {"!!": [{"var": "results.missing.value"}]},
+    {"var": ["results.missing.value", "fallback"]},
+    {"var": "results.tags.1"},
+    {"var": ["results.tags.x", "default"]},
+    {"var": 0},
+    {"var": "results.platforms.0.os"},
+    {"var": "results.platforms.0.labels.b"},
+    {"var": "results.trivy.fixed_count.x"},
+    {"var": "results.trivy.critical_count.x"},
+    {"var": "results.skopeo.labels"},
+    {"in": ["maintainer", {"var": "results.skopeo.labels"}]},
+    {"in": ["author", {"var": "results.skopeo.labels"}]},
+    {"get": [{"var": "results.skopeo"}, "missing"]},
+    {"var": ""},
+    {"var": [{"cat": ["request.", "registry"]}]},
+    {"and": [True, {"var": "results.trivy.high_count"}, 0]},
+    {"or": [0, "", {"var": "results.trivy.high_count"}]},
+    {"and": []},
+    {"if": [{"var": "results.missing"}, "yes", "no"]},
+    {"if": [False, 1, {"var": "request.registry"}, 2, 3]},
+    {"if": [False, 1, 0, 2]},
+    {"if": [{"var": "request.registry"}]},
+    {"if": []},
+    {"?:": [True, {"var": "results.trivy.high_count"}, {"var": "results.nope"}]},
+    {"some": [{"var": "results.tags"}, {"==": [{"var": ""}, "latest"]}]},
+    {"intersects": [{"var": "results.tags"}, ["latest", "edge"]]},
+    {"keys": [{"var": "results.skopeo.labels"}]},
+    {"get": [{"var": "results.skopeo.labels"}, "maintainer"]},
+    {"env_contains": [{"var": "results.skopeo.env"}, ["DEBUG"]]},
+    {"missing": ["results.trivy.critical_count", "results.nope"]},
+    {"cat": ["a", {"var": "results.trivy.high_count"}, "b"]},
+    {"+": [1, 2, 3]},
+    [1, {"var": "request.registry"}],
+    {"a": 1, "b": 2},
+    42,
+]
+
+
+@pytest.mark.parametrize("condition", CONDITIONS)
+def test_matches_jsonlogic(condition):
+    assert compile_condition(condition)(DATA) == jsonLogic(condition, DATA)
+
+
+@pytest.mark.parametrize("condition", CONDITIONS)
+def test_matches_jsonlogic_missing_tracking(condition):
+    expected_tracker = MissingDataTracker(DATA)
+    expected = jsonLogic(condition, expected_tracker)
+
+    tracker = MissingDataTracker(DATA)
+    assert compile_condition(condition)(tracker) == expected
+    assert tracker.missing_accessed == expected_tracker.missing_accessed
+    assert tracker.accessed_keys == expected_tracker.accessed_keys
+
+
+def test_var_index_error_propagates_like_jsonlogic():
+    condition = {"var": "results.tags.9"}
+    with pytest.raises(IndexError):
+        jsonLogic(condition, DATA)
+    with pytest.raises(IndexError):
+        compile_condition(condition)(DATA)
+
+
+def test_var_too_many_arguments_raises_like_jsonlogic():
+    condition = {"var": ["request.registry", "a", "b"]}
+    with pytest.raises(TypeError):
+        jsonLogic(condition, DATA)
+    with pytest.raises(TypeError):
+        compile_condition(condition)(DATA)
+
+
+def test_falsy_data_defaults_to_empty_dict():
+    assert compile_condition({"var": ""})(None) == jsonLogic({"var": ""}, None)
+
+
+def test_unknown_operator_raises_like_jsonlogic():
+    with pytest.raises(ValueError, match="Unrecognized operation"):
+        compile_condition({"nope": [1]})(DATA)
+
+
+def test_equal_conditions_share_compilation():
+    assert compile_condition({">": [{"var": "x"}, 1]}) is compile_condition(
+        {">": [{"var": "x"}, 1]}
+    )
+
+
+def test_non_json_condition_is_compiled():
+    day = datetime.date(2024, 1, 1)
+    condition = {"==": [{"var": "day"}, day]}
+    assert compile_condition(condition)({"day": day}) is True
+
+
+def test_cached_closure_ignores_later_mutation():
+    condition = {"in": [{"var": "x"}, ["a"]]}
+    compiled = compile_condition(condition)
+    condition["in"][1].append("b")
+    assert compiled({"x": "b"}) is False
+
+
+@pytest.mark.parametrize(
+    ("condition", "expected"),
+    [
+        ({"==": [1, 1]}, False),
+        ({"and": [True, {"!": [False]}]}, False),
+        ([1, {"+": [1, 2]}], False),
+        (True, False),
+        ({">": [{"var": "x"}, 1]}, True),
+        ({"and": [True, {"missing": ["x"]}]}, True),
+        ({"some": [[1, 2], {"==": [1, 1]}]}, True),
+        ({"unknown.op": [1]}, True),
+    ],
+)
+def test_reads_data(condition, expected):
+    assert reads_data(condition) is expected
+
+
+def test_reads_data_is_cached_with_the_compilation():
+    condition = {">": [{"var": "cached_flag"}, 1]}
+    compile_condition(condition)
+    with patch("regis.rules.compiler._uses_ops") as uses_ops:
+        assert reads_data(condition) is True
+    uses_ops.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [
+        {"and": [False, {"var": "results.nope"}]},
+        {"or": [True, {"var": "results.nope"}]},
+        {"if": [True, 1, {"var": "results.nope"}]},
+        {"?:": [False, {"var": "results.nope"}, 2]},
+    ],
+)
+def test_skipped_branches_do_not_flag_missing(condition):
+    tracker = MissingDataTracker(DATA)
+    compile_condition(condition)(tracker)
+    assert tracker.missing_accessed is False
+    assert "results.nope" not in tracker.accessed_keys
+
+
+def test_constant_subtrees_are_folded():
+    calls = []
+    json_logic.add_operation("test_counted", lambda: calls.append(1) or 3)
+    try:
+        compiled = compile_condition({"<": [{"var": "x"}, {"test_counted": []}]})
+        assert compiled({"x": 1}) is True
+        assert compiled({"x": 5}) is False
+    finally:
+        json_logic.rm_operation("test_counted")
+    assert len(calls) == 1
+
+
+def test_constant_errors_surface_at_evaluation():
+    compiled = compile_condition({"==": [{"/": [1, 0]}, 1]})
+    with pytest.raises(ZeroDivisionError):
+        compiled(DATA)
+
+
+def test_log_is_not_folded(caplog):
+    compiled = compile_condition({"log": "hello"})
+    with caplog.at_level(logging.INFO, logger="json_logic"):
+        compiled(DATA)
+        compiled(DATA)
+    assert caplog.messages.count("hello") == 2
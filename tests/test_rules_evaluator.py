@@ -91,3 +91,18 @@ def test_evaluate_rule_params():
     freshness2 = next(r for r in res2["rules"] if r["slug"] == "age")
     assert freshness2["passed"] is False
     assert freshness2["message"] == "Image is older than 7 days (15 days)."
+
+
+def test_evaluate_rules_deeply_nested_condition_fails_rule(caplog):
+    condition: object = {"var": "request.registry"}
+    for _ in range(1200):
+        condition = {"!": [condition]}
+    report = {"request": {"registry": "docker.io", "analyzers": []}, "results": {}}
+    rules_def = {"rules": [{"slug": "deep", "condition": condition}]}
+
+    res = evaluate_rules(report, rules_def)
+
+    deep = next(r for r in res["rules"] if r["slug"] == "deep")
+    assert deep["passed"] is False
+    assert deep["status"] == "failed"
+    assert "Rule 'deep' evaluation error" in caplog.text
@@ -2,7 +2,15 @@
 
 from unittest.mock import patch
 
-from regis.utils.report import escape_jinja, run_playbooks
+import click
+import pytest
+
+from regis.utils.report import (
+    _load_schema_registry,
+    escape_jinja,
+    run_playbooks,
+    validate_report,
+)
 
 
 class TestEscapeJinja:
@@ -164,3 +172,16 @@ class TestRunPlaybooks:
             result = run_playbooks((), self._ANALYSIS_REPORT, formats=["json"])
             # Either the default was loaded or no paths existed
             assert isinstance(result, dict)
+
+
+class TestValidateReport:
+    def test_invalid_report_raises(self):
+        with pytest.raises(click.ClickException, match="'results' is a required"):
+            validate_report({"request": {}})
+
+    def test_schemas_are_loaded_once(self):
+        _load_schema_registry.cache_clear()
+        for _ in range(3):
+            with pytest.raises(click.ClickException):
+                validate_report({"request": {}})
+        assert _load_schema_registry.cache_info().misses == 1